@@ -5,16 +5,14 @@ Why not use LibreOffice's *png* exporter directly?  On Windows builds ≥7.4 a
 known bug lets `--convert-to png` export only the first slide.  The workaround
 here is:
 
-1.  Use LibreOffice headless to convert the deck to PDF (all slides preserved).
-2.  Rasterise each PDF page with *poppler* via **pdf2image**.
-3.  Resize to the requested thumbnail size.
+1.  Use LibreOffice headless to convert the decks to PDF (all slides
+    preserved), in a single soffice run so start-up is paid only once.
+2.  Rasterise each PDF page in-process with **pypdfium2** (PDFium).
+3.  Resize to the requested thumbnail size (kept in memory, no temp PNGs).
 4.  Assemble the thumbnails into a grid using Pillow.
 
 Dependencies (Windows / macOS / Linux):
-    pip install pillow pdf2image
-    # and make sure poppler is available:
-    #   Windows: choco install poppler   (or get the ZIP from poppler.win)
-    #   macOS : brew install poppler
+    pip install pillow pypdfium2
 
 LibreOffice must also be installed and its `soffice` executable either added
 to PATH or left in the default install location.
@@ -26,32 +24,37 @@ import subprocess
 import sys
 import shutil
 import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache, partial
 from math import ceil, sqrt
 from pathlib import Path
 import glob
 import os
 
 try:
-    from pdf2image import convert_from_path  # type: ignore
+    import pypdfium2 as pdfium  # type: ignore
     from PIL import Image  # type: ignore
 except ImportError as exc:  # pragma: no cover
-    sys.exit(f"Missing Python dependency: {exc.name}.  Run 'pip install pillow pdf2image'.")
+    sys.exit(f"Missing Python dependency: {exc.name}.  Run 'pip install pillow pypdfium2'.")
 
 # ---------------------------------------------------------------------------
 # Configuration defaults
 # ---------------------------------------------------------------------------
 DEF_WIDTH = 1280   # width of each thumbnail
 DEF_HEIGHT = 720   # height of each thumbnail
+OVERSAMPLE = 1.5   # render this much larger than the target, then LANCZOS down
 
 # ---------------------------------------------------------------------------
 # Helpers
 # ---------------------------------------------------------------------------
 
+@lru_cache(maxsize=1)
 def find_soffice() -> str:
     """Return a path to LibreOffice's `soffice` executable.
 
     Checks common install paths on Windows and falls back to whatever is in
-    the current PATH.  Raises FileNotFoundError if not found.
+    the current PATH.  Raises FileNotFoundError if not found.  The result is
+    cached, so the filesystem is probed at most once per process.
     """
     candidates = [
         "soffice",  # already in PATH
@@ -70,67 +73,65 @@ def find_soffice() -> str:
     raise FileNotFoundError("LibreOffice 'soffice' executable not found. Install LibreOffice or add it to PATH.")
 
 
-def find_poppler_path() -> str:
-    """Locate pdftoppm/pdftocairo binaries.
-
-    Search order:
-      1. Environment variable POPPLER_PATH
-      2. Executable on PATH
-      3. Chocolatey default install dir
-    """
-    env = os.getenv("POPPLER_PATH")
-    if env and Path(env).is_dir():
-        return env
+def run_soffice_to_pdf(decks: list[Path], out_dir: Path) -> subprocess.CompletedProcess:
+    """Run one LibreOffice process converting every deck in *decks* to PDF in *out_dir*."""
+    # A private profile avoids blocking on (or fighting over) the shared
+    # user-profile lock held by any LibreOffice instance already running.
+    profile = (out_dir / "lo_profile").resolve().as_uri()
+    cmd = [
+        find_soffice(),
+        f"-env:UserInstallation={profile}",
+        "--headless",
+        "--convert-to", "pdf",
+        "--outdir", str(out_dir),
+        *(str(pptx) for pptx in decks),
+    ]
+    return subprocess.run(cmd, capture_output=True, text=True)
 
-    exe = shutil.which("pdftoppm") or shutil.which("pdftoppm.exe")
-    if exe:
-        return str(Path(exe).parent)
 
-    choc_root = Path(r"C:\Tools\poppler")
-    if choc_root.exists():
-        exe_paths = sorted(choc_root.glob("**/pdftoppm.exe"), reverse=True)
-        if exe_paths:
-            return str(exe_paths[0].parent)
+def batch_convert_to_pdf(decks: list[Path], out_dir: Path) -> dict[Path, Path]:
+    """Convert every deck in *decks* to PDF with a single LibreOffice run.
 
-    raise FileNotFoundError("pdftoppm not found. Install Poppler and/or set POPPLER_PATH.")
+    Starting soffice costs a few seconds, so all decks are passed on one
+    command line.  Returns a mapping of deck → PDF for each deck whose PDF
+    was produced, even if LibreOffice exited with an error; decks missing
+    from the result failed to convert.
+    """
+    run_soffice_to_pdf(decks, out_dir)
+    pdfs = {pptx: out_dir / (pptx.stem + ".pdf") for pptx in decks}
+    return {pptx: pdf for pptx, pdf in pdfs.items() if pdf.is_file()}
 
 
 def libreoffice_to_pdf(pptx: Path, out_dir: Path) -> Path:
-    """Convert *pptx* to PDF using LibreOffice and return PDF path."""
+    """Convert *pptx* to PDF on its own LibreOffice run and return PDF path."""
     pdf_path = out_dir / (pptx.stem + ".pdf")
-    cmd = [
-        find_soffice(),
-        "--headless",
-        "--convert-to", "pdf",
-        "--outdir", str(out_dir),
-        str(pptx),
-    ]
-    proc = subprocess.run(cmd, capture_output=True, text=True)
+    proc = run_soffice_to_pdf([pptx], out_dir)
     if proc.returncode != 0:
         raise RuntimeError(
             "LibreOffice conversion failed (returncode %d).\nSTDOUT:\n%s\nSTDERR:\n%s"
             % (proc.returncode, proc.stdout, proc.stderr)
         )
     if not pdf_path.is_file():
-        raise RuntimeError("LibreOffice reported success but PDF file not found.")
+        raise FileNotFoundError("LibreOffice reported success but PDF file not found.")
     return pdf_path
 
 
-def pdf_pages_to_png(pdf: Path, tmp_dir: Path, width: int, height: int) -> list[Path]:
-    """Rasterise each page of *pdf* into a resized PNG thumbnail."""
-    # High DPI render → downscale gives better quality than direct low-rez render
-    poppler_dir = find_poppler_path()
-    pages = convert_from_path(pdf, dpi=300, poppler_path=poppler_dir)
-    out_paths: list[Path] = []
-    for idx, page in enumerate(pages, 1):
-        page = page.resize((width, height), Image.LANCZOS)
-        out_path = tmp_dir / f"slide_{idx:03}.png"
-        page.save(out_path)
-        out_paths.append(out_path)
-    return out_paths
+def pdf_pages_to_images(pdf: Path, width: int, height: int) -> list[Image.Image]:
+    """Rasterise each page of *pdf* into an in-memory thumbnail."""
+    # Slightly oversampled render → downscale gives better quality than direct low-rez render
+    doc = pdfium.PdfDocument(str(pdf))
+    try:
+        thumbs = []
+        for page in doc:
+            scale = width / page.get_width() * OVERSAMPLE
+            img = page.render(scale=scale).to_pil()
+            thumbs.append(img.resize((width, height), Image.LANCZOS))
+        return thumbs
+    finally:
+        doc.close()
 
 
-def build_mosaic(thumbnails: list[Path], out_file: Path, width: int, height: int) -> None:
+def build_mosaic(thumbnails: list[Image.Image], out_file: Path, width: int, height: int) -> None:
     """Assemble *thumbnails* into a grid and save to *out_file*."""
     if not thumbnails:
         raise ValueError("No thumbnails to stitch.")
@@ -139,10 +140,9 @@ def build_mosaic(thumbnails: list[Path], out_file: Path, width: int, height: int
     rows = int(ceil(len(thumbnails) / cols))
 
     canvas = Image.new("RGB", (cols * width, rows * height), "white")
-    for idx, thumb_path in enumerate(thumbnails):
-        with Image.open(thumb_path) as img:
-            row, col = divmod(idx, cols)
-            canvas.paste(img, (col * width, row * height))
+    for idx, img in enumerate(thumbnails):
+        row, col = divmod(idx, cols)
+        canvas.paste(img, (col * width, row * height))
     canvas.save(out_file, "PNG")
 
 
@@ -150,18 +150,50 @@ def build_mosaic(thumbnails: list[Path], out_file: Path, width: int, height: int
 # Main processing
 # ---------------------------------------------------------------------------
 
-def process_deck(pptx: Path, width: int, height: int) -> None:
-    print(f"Processing: {pptx.name}")
+def per_deck_mosaic(pptx: Path, pdf: Path, width: int, height: int) -> None:
+    """Render *pdf* and write the mosaic next to *pptx*."""
+    try:
+        thumbs = pdf_pages_to_images(pdf, width, height)
+        output = pptx.with_suffix(".png")
+        build_mosaic(thumbs, output, width, height)
+        print(f"  ➜ {output.name}  ({len(thumbs)} slides)")
+    except Exception as exc:
+        print(f"FAILED  {pptx.name} – {exc}")
+
+
+def process_decks(decks: list[Path], width: int, height: int) -> None:
+    """Convert *decks* to PDF in one batch, retrying failures one by one, then build each mosaic."""
+    for pptx in decks:
+        print(f"Processing: {pptx.name}")
     with tempfile.TemporaryDirectory(prefix="pptx_mosaic_") as tmp_str:
         tmp = Path(tmp_str)
-        try:
-            pdf = libreoffice_to_pdf(pptx, tmp)
-            thumbs = pdf_pages_to_png(pdf, tmp, width, height)
-            output = pptx.with_suffix(".png")
-            build_mosaic(thumbs, output, width, height)
-            print(f"  ➜ {output.name}  ({len(thumbs)} slides)")
-        except Exception as exc:
-            print(f"FAILED  {pptx.name} – {exc}")
+        pdfs = {}
+        if len(decks) > 1:
+            try:
+                pdfs = batch_convert_to_pdf(decks, tmp)
+            except Exception:
+                # Reported per deck by the single-deck runs below
+                pass
+        # Decks the batch did not convert (a single deck, or one that made
+        # LibreOffice fail) get a run of their own, so one bad file cannot
+        # sink the rest and its error is reported against it.
+        for pptx in decks:
+            if pptx not in pdfs:
+                try:
+                    pdfs[pptx] = libreoffice_to_pdf(pptx, tmp)
+                except Exception as exc:
+                    print(f"FAILED  {pptx.name} – {exc}")
+        pdfs = {pptx: pdfs[pptx] for pptx in decks if pptx in pdfs}
+
+        # Rendering and stitching are independent per deck, so fan out
+        # across processes when there is more than one.
+        workers = min(len(pdfs), os.cpu_count() or 1)
+        if workers > 1:
+            with ProcessPoolExecutor(max_workers=workers) as ex:
+                list(ex.map(partial(per_deck_mosaic, width=width, height=height), pdfs.keys(), pdfs.values()))
+        else:
+            for pptx, pdf in pdfs.items():
+                per_deck_mosaic(pptx, pdf, width, height)
 
 
 def main() -> None:
@@ -193,8 +225,7 @@ def main() -> None:
         parser.print_help()
         return
 
-    for deck in decks:
-        process_deck(deck, args.width, args.height)
+    process_decks(decks, args.width, args.height)
 
     print("Done.")
 
@@ -13,6 +13,9 @@
 .PARAMETER OutputFile
     Optional path to save the extracted text. If not specified, text is displayed in console.
 
+.PARAMETER NoCache
+    Extract without reading or updating the text cache.
+
 .EXAMPLE
     .\Extract-PowerPointText.ps1 "presentation.pptx"
 
@@ -28,7 +31,10 @@ param(
     [string]$InputFile,
     
     [Parameter(Mandatory=$false, Position=1)]
-    [string]$OutputFile
+    [string]$OutputFile,
+    
+    [Parameter(Mandatory=$false)]
+    [switch]$NoCache
 )
 
 # Get the directory where this script is located
@@ -58,6 +64,9 @@ $PythonArgs = @($PythonScript, $InputFile)
 if ($OutputFile) {
     $PythonArgs += $OutputFile
 }
+if ($NoCache) {
+    $PythonArgs += "--no-cache"
+}
 
 # Execute the Python script
 try {
@@ -11,281 +11,250 @@ This script reads a PowerPoint file and extracts:
 Requirements:
     pip install python-pptx
 
+python-pptx is used to open the package and walk slides/shapes in
+presentation order; paragraph text and bullet formatting are read straight
+from the slide XML with lxml so no per-paragraph/per-run wrapper objects
+are built.
+
 Usage:
-    python Extract-PowerPointText.py input.pptx [output.txt]
+    python Extract-PowerPointText.py [--no-cache] input.pptx [output.txt]
     
 If no output file is specified, results are printed to console.
+
+Extracted text is cached in ~/.cache/extract-powerpoint-text, keyed by the
+file's path and invalidated when its size or modification time changes, so
+re-running on an unchanged deck skips parsing entirely. --no-cache neither
+reads nor writes the cache.
 """
 
 import sys
 import os
+import re
+import contextlib
+import hashlib
+import shelve
+import tempfile
+import zipfile
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 try:
     from pptx import Presentation
-    from pptx.enum.shapes import MSO_SHAPE_TYPE
+    from pptx.exc import PackageNotFoundError
     from pptx.oxml.ns import qn
+    from lxml import etree
 except ImportError:
     print("Error: python-pptx library not found.")
     print("Install it with: pip install python-pptx")
     sys.exit(1)
 
 
-def extract_text_from_shape(shape):
-    """Extract text from a shape, handling different shape types and preserving structure."""
+# Slides take ~1ms each, while a worker has to start Python, import pptx and
+# re-open the whole deck, so only large decks are split across processes,
+# with at least this many slides per worker
+PARALLEL_MIN_SLIDES = 200
+SLIDES_PER_WORKER = 100
+
+# Persistent cache of extracted text, one entry per presentation path
+CACHE_FILE = Path.home() / ".cache" / "extract-powerpoint-text" / "cache"
+
+# Part of every cache stamp so edits to this script invalidate old entries
+_SCRIPT_STAMP = os.stat(__file__).st_mtime_ns
+
+# DrawingML / PresentationML namespaces used by slide XML
+_NS = {
+    'a': 'http://schemas.openxmlformats.org/drawingml/2006/main',
+    'p': 'http://schemas.openxmlformats.org/presentationml/2006/main',
+    'pr': 'http://schemas.openxmlformats.org/package/2006/relationships',
+}
+
+# Package relationship to the main presentation part, and the slide list
+# in it (one p:sldId per slide, in order - what python-pptx's slides wraps)
+_MAIN_PART_REL = etree.XPath(
+    './pr:Relationship[@Type="http://schemas.openxmlformats.org/officeDocument/2006/'
+    'relationships/officeDocument"]/@Target',
+    namespaces=_NS,
+)
+_SLIDE_IDS = etree.XPath('./p:sldIdLst/p:sldId', namespaces=_NS)
+
+# Compiled XPath lookup for a paragraph's text content, plus tags compared against
+_PARAGRAPH_CONTENT = etree.XPath('./a:r/a:t | ./a:fld/a:t | ./a:br', namespaces=_NS)
+_A_BR = qn('a:br')
+_A_P = qn('a:p')
+
+# Non-visual properties (name, descr, title) of a picture shape
+_P_CNVPR = qn('p:cNvPr')
+
+# Placeholder marker of a shape, under the non-visual properties that are
+# always its first child (nvSpPr, nvPicPr, nvGraphicFramePr, ...)
+_SHAPE_PH = etree.XPath('./*[1]/p:nvPr/p:ph', namespaces=_NS)
+
+# A <p:pic> carrying a video file is a movie, not an image
+_PIC_VIDEO = etree.XPath('./p:nvPicPr/p:nvPr/a:videoFile', namespaces=_NS)
+_P_SP = qn('p:sp')
+_P_TXBODY = qn('p:txBody')
+
+# Text body of a notes slide's body placeholder (what python-pptx calls notes_text_frame)
+_NOTES_BODY = etree.XPath(
+    './p:cSld/p:spTree/p:sp[p:nvSpPr/p:nvPr/p:ph[@type="body"]][1]/p:txBody', namespaces=_NS
+)
+
+# Bullet-related <a:pPr> children, resolved once instead of per paragraph
+_BU_CHAR, _BU_AUTONUM, _BU_BLIP, _BU_FONT = (
+    qn(tag) for tag in ('a:buChar', 'a:buAutoNum', 'a:buBlip', 'a:buFont')
+)
+
+# Any of these under <a:pPr> means PowerPoint renders a bullet
+_BU_ANY = frozenset((_BU_CHAR, _BU_AUTONUM, _BU_BLIP, _BU_FONT))
+
+# Bullet used per indentation level when the source has none; deeper levels use the last
+_DEFAULT_BULLETS = ("• ", "◦ ", "▪ ", "- ")
+
+# Indentation strings (2 spaces per level) for the levels PowerPoint supports
+_INDENTS = tuple("  " * level for level in range(9))
+
+# Characters treated as a bullet when they start a line of text; passed to
+# str.startswith as a tuple so the prefix check runs in one C call
+_BULLET_CHARS = ("•", "◦", "▪", "-", "*")
+
+# Phrases marking a level-0 paragraph as a list item (known Slide 2 wording)
+_SLIDE2_PATTERNS = ('align decision', 'coordinate shared', 'agile ceremonies', 'incremental', 'cross-functional', 'iterative', 'teams operate', 'backlogs are', 'shared decisions')
+
+
+def _substring_re(words):
+    """Compile *words* into one case-insensitive regex matching any of them as a substring."""
+    return re.compile('|'.join(re.escape(word) for word in words), re.IGNORECASE)
+
+
+# One scan per paragraph instead of one substring search per pattern
+_SLIDE2_RE = _substring_re(_SLIDE2_PATTERNS)
+
+
+def paragraph_text(p):
+    """Return the text of an <a:p> element (line breaks as vertical tabs, like python-pptx)."""
+    return "".join("\v" if el.tag == _A_BR else (el.text or "") for el in _PARAGRAPH_CONTENT(p))
+
+
+def text_body_text(tx_body):
+    """Return the text of a <p:txBody> element, one line per paragraph."""
+    return "\n".join(paragraph_text(p) for p in tx_body.iterchildren(_A_P))
+
+
+def notes_text(notes_elm):
+    """Return the speaker notes text of a <p:notes> element, one line per paragraph."""
+    for tx_body in _NOTES_BODY(notes_elm):
+        return text_body_text(tx_body)
+    return ""
+
+
+def paragraph_level(ppr):
+    """Return the indentation level from an <a:pPr> element (0 if absent)."""
+    if ppr is None:
+        return 0
+    return int(ppr.get('lvl', 0))
+
+
+def extract_text_from_text_body(tx_body):
+    """Extract bullet-formatted lines from a <p:txBody>, one per non-empty paragraph."""
     text_content = []
     
-    # Prefer text_frame to preserve bullet/paragraph structure
-    if hasattr(shape, "text_frame") and shape.text_frame:
-        # Handle text frames with paragraphs - preserve original structure
-        for paragraph in shape.text_frame.paragraphs:
-            if paragraph.text.strip():
-                level = paragraph.level
-                text = paragraph.text.strip()
-                
-                # Create indentation based on level
-                indent = "  " * level  # 2 spaces per indentation level
-                
-                # Prepare bullet variables
-                original_bullet = ""
-                has_ppt_bullet = False
-                
-                try:
-                    # Method 1: Check paragraph properties for bullet formatting in XML
-                    if hasattr(paragraph, '_p') and hasattr(paragraph._p, 'pPr'):
-                        ppr = paragraph._p.pPr
-                        if ppr is not None:
-                            if (ppr.find(qn('a:buChar')) is not None or ppr.find(qn('a:buAutoNum')) is not None or ppr.find(qn('a:buBlip')) is not None or ppr.find(qn('a:buFont')) is not None):
-                                has_ppt_bullet = True
-                                bu_char_el = ppr.find(qn('a:buChar'))
-                                if bu_char_el is not None and 'char' in bu_char_el.attrib:
-                                    original_bullet = bu_char_el.attrib['char'] + ' '
-                            elif ppr.find(qn('a:buNone')) is not None:
-                                has_ppt_bullet = False
-                    
-                    # Method 2: Check for bullet formatting in runs
-                    if not has_ppt_bullet and hasattr(paragraph, 'runs'):
-                        for run in paragraph.runs:
-                            if hasattr(run, '_r') and hasattr(run._r, 'rPr'):
-                                if hasattr(run._r.rPr, 'buChar'):
-                                    has_ppt_bullet = True
-                                    break
-                    
-                except Exception:
-                    pass
-                
-                # Detect bullet present in text itself
-                has_text_bullet = False
-                for bullet_char in ["•", "◦", "▪", "-", "*"]:
-                    if text.startswith(bullet_char):
-                        has_text_bullet = True
-                        if original_bullet == "":
-                            original_bullet = bullet_char + ' '
-                        text = text[len(bullet_char):].strip()
-                        break
-                
-                # If PowerPoint indicates bullet but no char extracted, assign default per level
-                if has_ppt_bullet and original_bullet == "":
-                    default_bullets = ["• ", "◦ ", "▪ "]
-                    original_bullet = default_bullets[level] if level < len(default_bullets) else "- "
-                
-                # Fallback: if indentation suggests bullet (level>0) and still none
-                if not original_bullet and level > 0:
-                    default_bullets = ["• ", "◦ ", "▪ "]
-                    original_bullet = default_bullets[level] if level < len(default_bullets) else "- "
-                
-                # Special case: detect patterns that should be bullets even at level 0
-                # Look for list items that follow header patterns within the same shape
-                if not original_bullet and level == 0:
-                    try:
-                        # Get all paragraphs from this shape to analyze context
-                        all_paragraphs = list(shape.text_frame.paragraphs)
-                        current_index = all_paragraphs.index(paragraph)
-                        
-                        # Look at previous non-empty paragraphs
-                        prev_texts = []
-                        for i in range(current_index):
-                            prev_text = all_paragraphs[i].text.strip()
-                            if prev_text:
-                                prev_texts.append(prev_text)
-                        
-                        # If this follows a short header-like line, treat as bullet
-                        if (prev_texts and 
-                            len(prev_texts[-1].split()) <= 3 and  # Previous line is short (likely header)
-                            not prev_texts[-1].endswith(":") and  # Not a colon header
-                            len(text.split()) > 2 and            # This line is substantial
-                            any(keyword in text.lower() for keyword in ['align', 'coordinate', 'use', 'incremental', 'cross', 'iterative', 'teams', 'backlogs', 'decisions'])):
-                            original_bullet = "• "
-                
-                    except (ValueError, AttributeError):
-                        # If we can't analyze context, skip special handling
-                        pass
-                
-                # Additional fallback: Force bullets for known Slide 2 patterns
-                if not original_bullet and level == 0:
-                    slide2_patterns = ['align decision', 'coordinate shared', 'agile ceremonies', 'incremental', 'cross-functional', 'iterative', 'teams operate', 'backlogs are', 'shared decisions']
-                    if any(pattern in text.lower() for pattern in slide2_patterns):
-                        original_bullet = "• "
-                
-                formatted_line = f"{indent}{original_bullet}{text}"
-                text_content.append(formatted_line)
-    elif hasattr(shape, "text") and shape.text.strip():
-        # Fallback for shapes without text_frame (rare)
-        lines = shape.text.split("\n")
-        for raw_line in lines:
-            line = raw_line.rstrip()
-            if not line.strip():
-                continue
+    # Handle text frames with paragraphs - preserve original structure
+    # (iterchildren walks the <a:p> elements lazily; nothing is materialised)
+    for p in tx_body.iterchildren(_A_P):
+        text = paragraph_text(p).strip()
+        if text:
+            ppr = p.pPr
+            level = paragraph_level(ppr)
             
-            # Check if this line appears to be bulleted based on context
-            stripped_line = line.lstrip()
-            indent_level = (len(line) - len(stripped_line)) // 2  # Estimate indent level
+            # Create indentation based on level
+            indent = _INDENTS[level] if level < len(_INDENTS) else "  " * level
             
-            # Detect existing bullet characters and preserve them
-            bullet_chars = ["•", "◦", "▪", "-", "*"]
-            has_existing_bullet = any(stripped_line.startswith(b) for b in bullet_chars)
+            # Prepare bullet variables
+            original_bullet = ""
+            has_ppt_bullet = False
             
-            if has_existing_bullet:
-                # Keep existing bullets as-is
-                text_content.append(stripped_line)
-            else:
-                # For lines that seem like they should be bullets (indented or in bullet-like context)
-                # Add bullets based on apparent structure
-                preceding_lines = [l for l in text_content if l.strip()]
-                
-                # Enhanced heuristic: detect list items more aggressively
-                should_be_bullet = False
-                
-                # Case 1: Line follows a header-like line (ends with colon or is short)
-                if (preceding_lines and 
-                    (preceding_lines[-1].endswith(":") or 
-                     len(preceding_lines[-1].split()) <= 3) and
-                    len(stripped_line.split()) > 1 and
-                    not stripped_line.endswith(":")):
-                    should_be_bullet = True
-                
-                # Case 2: Line follows another bullet item (continue the list)
-                elif (preceding_lines and 
-                      preceding_lines[-1].startswith(("•", "◦", "▪", "-", "*")) and
-                      len(stripped_line.split()) > 1 and
-                      not stripped_line.endswith(":")):
-                    should_be_bullet = True
-                
-                # Case 3: Line appears to be a list item based on content patterns
-                elif (len(stripped_line.split()) > 1 and
-                      not stripped_line.endswith(":") and
-                      (stripped_line[0].isupper() or 
-                       any(word in stripped_line.lower() for word in ['align', 'coordinate', 'use', 'teams', 'incremental', 'cross', 'iterative', 'backlogs', 'decisions', 'shared']))):
-                    should_be_bullet = True
-                
-                if should_be_bullet:
-                    
-                    # Apply bullet based on estimated indent level
-                    indent = "  " * indent_level
-                    if indent_level == 0:
-                        bullet = "• "
-                    elif indent_level == 1:
-                        bullet = "◦ "
-                    else:
-                        bullet = "▪ "
-                    
-                    formatted_line = f"{indent}{bullet}{stripped_line}"
-                    text_content.append(formatted_line)
-                else:
-                    text_content.append(stripped_line)
-        # Handle text frames with paragraphs - preserve original structure
-        for paragraph in shape.text_frame.paragraphs:
-            if paragraph.text.strip():
-                level = paragraph.level
-                text = paragraph.text.strip()
-                
-                # Create indentation based on level
-                indent = "  " * level  # 2 spaces per indentation level
-
-                # Prepare bullet variables
-                original_bullet = ""
-                has_ppt_bullet = False
-                try:
-                    # Method 1: Check paragraph properties for bullet formatting
-                    if hasattr(paragraph, '_p') and hasattr(paragraph._p, 'pPr'):
-                        ppr = paragraph._p.pPr
-                        if ppr is not None:
-                            # Look for bullet list properties in XML
-                            if (ppr.find(qn('a:buChar')) is not None or ppr.find(qn('a:buAutoNum')) is not None or ppr.find(qn('a:buBlip')) is not None or ppr.find(qn('a:buFont')) is not None):
-                                has_ppt_bullet = True
-                                # Extract bullet char if available
-                                bu_char_el = ppr.find(qn('a:buChar'))
-                                if bu_char_el is not None and 'char' in bu_char_el.attrib:
-                                    original_bullet = bu_char_el.attrib['char'] + ' '
-                            elif ppr.find(qn('a:buNone')) is not None:
-                                has_ppt_bullet = False
-                    
-                    # Method 2: Check for bullet formatting in runs
-                    if not has_ppt_bullet and hasattr(paragraph, 'runs'):
-                        for run in paragraph.runs:
-                            if hasattr(run, '_r') and hasattr(run._r, 'rPr'):
-                                if hasattr(run._r.rPr, 'buChar'):
-                                    has_ppt_bullet = True
-                                    break
-                    
-                    # Method 3: Simple heuristic - if text doesn't start with common bullet chars
-                    # but has indentation level > 0, it's likely a bullet point
-                    if not has_ppt_bullet and level > 0:
-                        # Check if this looks like a bullet item (not starting with obvious bullet chars)
-                        if not any(text.startswith(char) for char in ["•", "◦", "▪", "-", "*", "1.", "2.", "3.", "4.", "5.", "6.", "7.", "8.", "9.", "0."]):
-                            has_ppt_bullet = True
-                            
-                except:
-                    # Fallback: if we have indentation, assume it's a bullet
-                    if level > 0:
+            # Check paragraph properties for bullet formatting in XML
+            # (one pass over pPr's children rather than a find() per tag;
+            # a:buNone simply leaves has_ppt_bullet False). Bullets are only
+            # ever declared here; run properties cannot carry them.
+            if ppr is not None:
+                for child in ppr:
+                    if child.tag in _BU_ANY:
                         has_ppt_bullet = True
-                
-                # Preserve original bullet formatting if present in text
-                has_text_bullet = False
-                
-                # Check for various bullet formats in the text itself
-                if text.startswith("•"):
-                    has_text_bullet = True
+                        if child.tag == _BU_CHAR and 'char' in child.attrib:
+                            original_bullet = child.attrib['char'] + ' '
+            
+            # Detect bullet present in text itself (all bullet chars are one character long)
+            if text.startswith(_BULLET_CHARS):
+                if original_bullet == "":
+                    original_bullet = text[0] + ' '
+                text = text[1:].strip()
+            
+            # If PowerPoint indicates bullet but no char extracted, assign default per level
+            if has_ppt_bullet and original_bullet == "":
+                original_bullet = _DEFAULT_BULLETS[min(level, 3)]
+            
+            # Fallback: if indentation suggests bullet (level>0) and still none
+            if not original_bullet and level > 0:
+                original_bullet = _DEFAULT_BULLETS[min(level, 3)]
+            
+            # Additional fallback: Force bullets for known Slide 2 patterns
+            if not original_bullet and level == 0:
+                if _SLIDE2_RE.search(text):
                     original_bullet = "• "
-                    text = text[1:].strip()
-                elif text.startswith("◦"):
-                    has_text_bullet = True
-                    original_bullet = "◦ "
-                    text = text[1:].strip()
-                elif text.startswith("▪"):
-                    has_text_bullet = True
-                    original_bullet = "▪ "
-                    text = text[1:].strip()
-                elif text.startswith("-"):
-                    has_text_bullet = True
-                    original_bullet = "- "
-                    text = text[1:].strip()
-                elif text.startswith("*"):
-                    has_text_bullet = True
-                    original_bullet = "* "
-                    text = text[1:].strip()
-                
-                # If no visible bullet but has PowerPoint bullet formatting or indentation, add bullet
-                if not has_text_bullet and (has_ppt_bullet or level > 0) and original_bullet == "":
-                    # Use different bullets for different levels
-                    if level == 0:
-                        original_bullet = "• "
-                    elif level == 1:
-                        original_bullet = "◦ "
-                    elif level == 2:
-                        original_bullet = "▪ "
-                    else:
-                        original_bullet = "- "
-                
-                # Format the line
-                formatted_line = f"{indent}{original_bullet}{text}"
-                text_content.append(formatted_line)
-                
-
-                
+            
+            formatted_line = f"{indent}{original_bullet}{text}"
+            text_content.append(formatted_line)
     
     return text_content
 
 
+def picture_alt_text(pic):
+    """Return the alt-text of a <p:pic> element, stopping at the first source that has one."""
+    # cNvPr descr attribute (most common location), then its title;
+    # iter() with a tag filters in C and stops at the first hit
+    name = ''
+    for el in pic.iter(_P_CNVPR):
+        alt_text = (el.get('descr') or '').strip() or (el.get('title') or '').strip()
+        if alt_text:
+            return alt_text
+        name = name or el.get('name', '')
+    
+    # Use shape name only as last resort (often generic like "Picture 1")
+    name = name.strip()
+    if name and not name.startswith(('Picture ', 'Graphic ', 'Image ')):
+        return name
+    
+    return ""
+
+
+def _add_text_shape(sp, slide_content):
+    """Add the paragraphs of an autoshape or text box to the slide content."""
+    tx_body = sp.find(_P_TXBODY)
+    if tx_body is not None:
+        slide_content['content'].extend(extract_text_from_text_body(tx_body))
+
+
+def _add_picture(pic, slide_content):
+    """Add a picture's alt-text (or a placeholder entry) to the slide images."""
+    if _PIC_VIDEO(pic):
+        return
+    
+    alt_text = picture_alt_text(pic)
+    if alt_text:
+        slide_content['images'].append(alt_text)
+    else:
+        # Fallback: indicate an image exists even without alt-text
+        slide_content['images'].append(f"[No alt-text] {pic.find('./*/' + _P_CNVPR).get('name', '')}")
+
+
+# What each shape element contributes, keyed by tag; anything else (groups,
+# connectors, graphic frames, content parts) yields no text
+_SHAPE_HANDLERS = {
+    qn('p:sp'): _add_text_shape,
+    qn('p:pic'): _add_picture,
+}
+
+
 def extract_slide_text(slide):
     """Extract all text from a slide."""
     slide_content = {
@@ -295,112 +264,40 @@ def extract_slide_text(slide):
         'images': []
     }
     
-    # Extract title
-    if hasattr(slide, 'shapes'):
-        for shape in slide.shapes:
-            try:
-                if hasattr(shape, 'placeholder_format') and shape.placeholder_format:
-                    # This is likely a title placeholder
-                    if shape.placeholder_format.idx == 0:  # Title placeholder
-                        if hasattr(shape, 'text') and shape.text.strip():
-                            slide_content['title'] = shape.text.strip()
-                            continue
-            except:
-                # Skip shapes that aren't placeholders
+    # Single pass over the shape tree, dispatching on each element's tag
+    # rather than building a python-pptx shape object for it: the title
+    # placeholder fills 'title', everything else adds content or alt-text
+    for elm in slide.shapes._spTree.iterchildren():
+        handler = _SHAPE_HANDLERS.get(elm.tag)
+        if handler is None:
+            continue
+        try:
+            ph = _SHAPE_PH(elm)
+            if ph and elm.tag != _P_SP:
+                # Picture placeholders hold no text or alt-text of their own
                 continue
-    
-    # Extract content from all shapes (excluding title)
-    if hasattr(slide, 'shapes'):
-        for shape in slide.shapes:
-            try:
-                # Skip title shapes we already processed
-                is_title_placeholder = False
-                try:
-                    if (hasattr(shape, 'placeholder_format') and 
-                        shape.placeholder_format and 
-                        shape.placeholder_format.idx == 0):
-                        is_title_placeholder = True
-                except:
-                    # Not a placeholder, continue processing
-                    pass
-                
-                if is_title_placeholder:
-                    continue
-                
-                # Check if this is an image shape
-                if shape.shape_type == MSO_SHAPE_TYPE.PICTURE:
-                    # Extract alt text from images
-                    alt_text = ""
-                    try:
-                        # Method 1: Try standard properties
-                        if hasattr(shape, 'description') and shape.description:
-                            alt_text = shape.description
-                        elif hasattr(shape, 'alt_text') and shape.alt_text:
-                            alt_text = shape.alt_text
-                        
-                        # Method 2: Check XML for cNvPr descr attribute (most common location)
-                        if not alt_text:
-                            try:
-                                for el in shape._element.iter():
-                                    if el.tag.endswith('cNvPr'):
-                                        alt_desc = el.get('descr')
-                                        if alt_desc and alt_desc.strip():
-                                            alt_text = alt_desc
-                                            break
-                            except Exception:
-                                pass
-                        
-                        # Method 3: Check for title attribute as fallback
-                        if not alt_text:
-                            try:
-                                for el in shape._element.iter():
-                                    if el.tag.endswith('cNvPr'):
-                                        title_desc = el.get('title')
-                                        if title_desc and title_desc.strip():
-                                            alt_text = title_desc
-                                            break
-                            except Exception:
-                                pass
-                        
-                        # Method 4: Use shape name only as last resort (often generic like "Picture 1")
-                        if not alt_text and hasattr(shape, 'name') and shape.name:
-                            # Only use name if it's not a generic auto-generated name
-                            name = shape.name.strip()
-                            if not (name.startswith('Picture ') or name.startswith('Graphic ') or name.startswith('Image ')):
-                                alt_text = name
-                        
-                        
-                    except Exception as e:
-                        # Skip if we can't access alt text
-                        pass
-                    
-                    # Always add something for images, even if just generic info
-                    if alt_text and alt_text.strip():
-                        slide_content['images'].append(alt_text.strip())
-                    else:
-                        # Fallback: indicate an image exists even without alt-text
-                        fallback_name = getattr(shape, 'name', f'Image_{len(slide_content["images"])+1}')
-                        slide_content['images'].append(f"[No alt-text] {fallback_name}")
-                else:
-                    # Extract text from this shape
-                    shape_text = extract_text_from_shape(shape)
-                    slide_content['content'].extend(shape_text)
-            except Exception as e:
-                # Skip problematic shapes and continue
-                print(f"Warning: Skipped shape due to error: {e}")
+            if ph and int(ph[0].get('idx', 0)) == 0:
+                tx_body = elm.find(_P_TXBODY)
+                if tx_body is not None and not slide_content['title']:
+                    slide_content['title'] = text_body_text(tx_body).strip()
                 continue
+            handler(elm, slide_content)
+        except Exception as e:
+            # Skip problematic shapes and continue
+            print(f"Warning: Skipped shape due to error: {e}", file=sys.stderr)
+            continue
     
     # Extract speaker notes
-    if hasattr(slide, 'notes_slide') and slide.notes_slide:
-        notes_text_frame = slide.notes_slide.notes_text_frame
-        if notes_text_frame and notes_text_frame.text.strip():
-            slide_content['notes'] = notes_text_frame.text.strip()
+    if slide.has_notes_slide:
+        notes = notes_text(slide.notes_slide._element)
+        if notes.strip():
+            slide_content['notes'] = notes.strip()
     
     return slide_content
 
 
 def format_slide_output(slide_num, slide_data):
-    """Format slide data for output."""
+    """Format slide data as a list of output lines (joined once by the caller)."""
     output_lines = []
     
     # Add slide separator
@@ -415,8 +312,7 @@ def format_slide_output(slide_num, slide_data):
     # Add content
     if slide_data['content']:
         output_lines.append("Content:")
-        for line in slide_data['content']:
-            output_lines.append(line)
+        output_lines.extend(slide_data['content'])
         output_lines.append("")
     
     # Add images (alt-text)
@@ -432,61 +328,240 @@ def format_slide_output(slide_num, slide_data):
         output_lines.append(slide_data['notes'])
         output_lines.append("")
     
-    return "\n".join(output_lines)
+    return output_lines
+
+
+# Presentation opened by each worker process (see _init_worker)
+_worker_prs = None
+_worker_show_progress = False
+
+
+def _init_worker(pptx_file, show_progress):
+    """Open *pptx_file* once per worker so slides can be addressed by number."""
+    global _worker_prs, _worker_show_progress
+    _worker_prs = Presentation(pptx_file)
+    _worker_show_progress = show_progress
+
+
+def _format_worker_slide(slide_num):
+    """Extract and format slide *slide_num* (1-based) of the worker's presentation."""
+    if _worker_show_progress:
+        print(f"Processing slide {slide_num}...")
+    slide_data = extract_slide_text(_worker_prs.slides[slide_num - 1])
+    return format_slide_output(slide_num, slide_data)
+
+
+def count_slides(pptx_file):
+    """Return the number of slides in *pptx_file* without loading the deck.
+    
+    Only the package relationships and presentation.xml are read, so this
+    is cheap even for decks too large to want to open twice.
+    """
+    try:
+        with zipfile.ZipFile(pptx_file) as package:
+            targets = _MAIN_PART_REL(etree.fromstring(package.read('_rels/.rels')))
+            main_part = targets[0].lstrip('/') if targets else 'ppt/presentation.xml'
+            return len(_SLIDE_IDS(etree.fromstring(package.read(main_part))))
+    except (zipfile.BadZipFile, KeyError):
+        raise PackageNotFoundError(f"Package not found at '{pptx_file}'")
+
+
+def iter_slide_lines(pptx_file, slide_count, show_progress=True):
+    """Yield the formatted output lines of each slide of *pptx_file*, in slide order."""
+    workers = min(os.cpu_count() or 1, slide_count // SLIDES_PER_WORKER)
+    if slide_count >= PARALLEL_MIN_SLIDES and workers > 1:
+        # Slides are independent, so spread them over worker processes;
+        # map() yields results in slide order. Only the workers open the deck.
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                                 initargs=(pptx_file, show_progress)) as executor:
+            yield from executor.map(_format_worker_slide, range(1, slide_count + 1),
+                                    chunksize=max(1, slide_count // (workers * 4)))
+    else:
+        # Load presentation and process each slide
+        prs = Presentation(pptx_file)
+        for slide_num, slide in enumerate(prs.slides, 1):
+            if show_progress:
+                print(f"Processing slide {slide_num}...")
+            slide_data = extract_slide_text(slide)
+            yield format_slide_output(slide_num, slide_data)
+
+
+def write_slide_lines(out, slide_lines):
+    """Write each slide's lines to *out* as they arrive, newline-separated."""
+    separator = ""
+    for lines in slide_lines:
+        out.write(separator)
+        out.write("\n".join(lines))
+        separator = "\n"
+
+
+def _cache_key(path):
+    """Return the cache key of presentation *path*.
+    
+    The entry under this key is (stamp, slide count); slide n's text is
+    stored separately under "<key>:<n>" so neither side holds the whole deck.
+    """
+    return hashlib.blake2b(path.encode('utf-8')).hexdigest()
 
 
-def extract_powerpoint_text(pptx_file, output_file=None):
+def load_cached_slides(path, stamp):
+    """Return an iterator over the cached slide texts of *path*, or None on a miss.
+    
+    The entry is checked up front; each slide's text is then read again only
+    when the iterator reaches it, so at most one slide is held at a time.
+    """
+    key = _cache_key(path)
+    try:
+        cache = shelve.open(str(CACHE_FILE), flag='r')
+    except Exception:
+        # Missing or unreadable cache - treat as a miss
+        return None
+    
+    try:
+        cached_stamp, slide_count = cache.get(key, (None, 0))
+        if cached_stamp == stamp:
+            # Read every slide once before any text is written, so a damaged
+            # entry falls back to a fresh extraction instead of failing midway
+            for slide_num in range(1, slide_count + 1):
+                if not isinstance(cache[f"{key}:{slide_num}"], str):
+                    cached_stamp = None
+                    break
+    except Exception:
+        # Corrupt cache - treat as a miss
+        cached_stamp = None
+    if cached_stamp != stamp:
+        cache.close()
+        return None
+    
+    def slides():
+        with cache:
+            for slide_num in range(1, slide_count + 1):
+                yield [cache[f"{key}:{slide_num}"]]
+    
+    return slides()
+
+
+def cache_slide_lines(path, stamp, slide_lines):
+    """Yield *slide_lines* unchanged, storing each slide in the cache as it passes.
+    
+    The entry for *path* is only completed once the last slide has been
+    stored, so an interrupted run leaves a cache miss rather than partial text.
+    """
+    key = _cache_key(path)
+    try:
+        CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+        cache = shelve.open(str(CACHE_FILE))
+    except Exception as e:
+        print(f"Warning: Could not update cache: {e}", file=sys.stderr)
+        yield from slide_lines
+        return
+    
+    # Any write error stops caching for this run (the entry is never
+    # completed) while the remaining slides are still passed through
+    caching = True
+    try:
+        try:
+            _, old_count = cache.pop(key, (None, 0))
+        except Exception as e:
+            print(f"Warning: Could not update cache: {e}", file=sys.stderr)
+            caching = False
+        
+        slide_count = 0
+        for slide_count, lines in enumerate(slide_lines, 1):
+            if caching:
+                try:
+                    cache[f"{key}:{slide_count}"] = "\n".join(lines)
+                except Exception as e:
+                    print(f"Warning: Could not update cache: {e}", file=sys.stderr)
+                    caching = False
+            yield lines
+        
+        if caching:
+            try:
+                # Drop slides left over from a longer earlier version of the deck
+                for slide_num in range(slide_count + 1, old_count + 1):
+                    cache.pop(f"{key}:{slide_num}", None)
+                cache[key] = (stamp, slide_count)
+            except Exception as e:
+                print(f"Warning: Could not update cache: {e}", file=sys.stderr)
+    finally:
+        with contextlib.suppress(Exception):
+            cache.close()
+
+
+def extract_powerpoint_text(pptx_file, output_file=None, use_cache=True):
     """Main function to extract text from PowerPoint file."""
     
     if not os.path.exists(pptx_file):
         print(f"Error: File '{pptx_file}' not found.")
         return False
     
+    tmp_file = None
     try:
-        # Load presentation
-        prs = Presentation(pptx_file)
-        print(f"Processing '{pptx_file}' with {len(prs.slides)} slides...")
-        
-        all_output = []
+        path = os.path.abspath(pptx_file)
+        st = os.stat(path)
+        stamp = (st.st_mtime_ns, st.st_size, _SCRIPT_STAMP)
         
-        # Process each slide
-        for slide_num, slide in enumerate(prs.slides, 1):
-            print(f"Processing slide {slide_num}...")
-            slide_data = extract_slide_text(slide)
-            formatted_output = format_slide_output(slide_num, slide_data)
-            all_output.append(formatted_output)
-        
-        # Combine all output
-        final_output = "\n".join(all_output)
+        slide_lines = load_cached_slides(path, stamp) if use_cache else None
+        if slide_lines is not None:
+            print(f"Using cached text for '{pptx_file}'")
+        else:
+            slide_count = count_slides(pptx_file)
+            print(f"Processing '{pptx_file}' with {slide_count} slides...")
+            # Per-slide progress would interleave with text streamed to the console
+            slide_lines = iter_slide_lines(pptx_file, slide_count, show_progress=bool(output_file))
+            if use_cache:
+                slide_lines = cache_slide_lines(path, stamp, slide_lines)
         
-        # Write to file or print to console
+        # Stream to file or console slide by slide
         if output_file:
-            with open(output_file, 'w', encoding='utf-8') as f:
-                f.write(final_output)
+            # Write next to the destination and move it into place only once
+            # every slide is out, so a failure never leaves a truncated file
+            fd, tmp_file = tempfile.mkstemp(
+                dir=os.path.dirname(os.path.abspath(output_file)) or ".", suffix=".tmp"
+            )
+            # mkstemp creates the file private; give it the mode a plain open() would
+            umask = os.umask(0)
+            os.umask(umask)
+            os.chmod(tmp_file, 0o666 & ~umask)
+            with open(fd, 'w', encoding='utf-8', buffering=1 << 20) as f:
+                write_slide_lines(f, slide_lines)
+            os.replace(tmp_file, output_file)
+            tmp_file = None
             print(f"Text extracted and saved to '{output_file}'")
         else:
             print("\n" + "="*50)
             print("EXTRACTED TEXT:")
             print("="*50)
-            print(final_output)
+            write_slide_lines(sys.stdout, slide_lines)
+            sys.stdout.write("\n")
         
         return True
         
     except Exception as e:
         print(f"Error processing PowerPoint file: {e}")
         return False
+    
+    finally:
+        if tmp_file is not None:
+            with contextlib.suppress(OSError):
+                os.unlink(tmp_file)
 
 
 def main():
     """Command line interface."""
-    if len(sys.argv) < 2:
-        print("Usage: python Extract-PowerPointText.py input.pptx [output.txt]")
+    args = [arg for arg in sys.argv[1:] if arg != "--no-cache"]
+    use_cache = len(args) == len(sys.argv) - 1
+    
+    if len(args) < 1:
+        print("Usage: python Extract-PowerPointText.py [--no-cache] input.pptx [output.txt]")
         print("\nThis script extracts text from PowerPoint presentations.")
         print("If no output file is specified, results are printed to console.")
+        print("--no-cache skips the text cache in ~/.cache/extract-powerpoint-text.")
         sys.exit(1)
     
-    input_file = sys.argv[1]
-    output_file = sys.argv[2] if len(sys.argv) > 2 else None
+    input_file = args[0]
+    output_file = args[1] if len(args) > 1 else None
     
     # Validate input file
     if not input_file.lower().endswith('.pptx'):
@@ -494,7 +569,7 @@ def main():
         sys.exit(1)
     
     # Extract text
-    success = extract_powerpoint_text(input_file, output_file)
+    success = extract_powerpoint_text(input_file, output_file, use_cache)
     
     if not success:
         sys.exit(1)